@@ -1,22 +1,12 @@
 #!/usr/bin/env python3
 import argparse
+import os
 from pathlib import Path
 import modules.pdf2md as pdf2md
 import modules.mark2epub as mark2epub
-from marker.models import create_model_dict
-import torch
-                
 
 
 def main():
-    # --- Argument parsing and device check (no changes here) ---
-    if torch.cuda.is_available():
-        print("CUDA is available. Using GPU for processing.")
-    elif torch.mps.is_available():
-        print("MPS is available. Using Apple Silicon for processing.")
-    else:
-        print("CUDA is not available. Using CPU for processing.")
-        
     parser = argparse.ArgumentParser(
         description='Convert PDF files to EPUB format via Markdown'
     )
@@ -29,6 +19,9 @@ def main():
     parser.add_argument('--langs', type=str, default=None, help='Comma-separated list of languages')
     parser.add_argument('--skip-epub', action='store_true', help='Skip EPUB generation')
     parser.add_argument('--skip-md', action='store_true', help='Skip markdown generation')
+    parser.add_argument('--no-review', action='store_true', help='Skip interactive markdown review before EPUB generation')
+    parser.add_argument('--jobs', type=int, default=min(4, os.cpu_count() or 1), help='Number of parallel worker processes for PDF conversion')
+    parser.add_argument('--pipeline', action='store_true', help='Overlap PDF reads, conversion and output writes in a single process (implies --jobs 1)')
     
     args = parser.parse_args()
     
@@ -36,11 +29,7 @@ def main():
     input_path = Path(args.input_path) if args.input_path else pdf2md.get_default_input_dir()
     queue = pdf2md.add_pdfs_to_queue(input_path)
     print(f"Found {len(queue)} PDF files to process")
-    
-    print("Loading models (this may take a moment)...")
-    models = create_model_dict()
-    print("Models loaded successfully.")
-    
+
     # =========================================================
     # 1. ESTABLISH A CLEAR, TOP-LEVEL OUTPUT DIRECTORY
     # =========================================================
@@ -51,36 +40,84 @@ def main():
         top_level_output_dir = Path.cwd() / 'output'
     top_level_output_dir.mkdir(exist_ok=True)
 
+    # With multiple PDFs and --jobs > 1, the PDF->Markdown stage runs across
+    # worker processes (each worker loads the models once); otherwise the
+    # models load in this process and conversion happens in the loop below.
+    run_parallel = not args.skip_md and not args.pipeline and args.jobs > 1 and len(queue) > 1
+    # Single-process alternative to worker parallelism: one converter (one
+    # model copy, one GPU) with the disk-bound stages of neighbouring PDFs
+    # overlapped around it
+    run_pipelined = not args.skip_md and args.pipeline and len(queue) > 1
+
+    # torch and the marker models are only needed for the PDF->Markdown stage;
+    # importing them lazily keeps --help and --skip-epub/--skip-md EPUB-only
+    # runs from paying the multi-second torch startup cost. The models
+    # themselves load lazily inside pdf2md on the first conversion.
+    models_factory = None
+    if not args.skip_md:
+        import torch
+
+        if torch.cuda.is_available():
+            print("CUDA is available. Using GPU for processing.")
+        elif hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+            print("MPS is available. Using Apple Silicon for processing.")
+        else:
+            print("CUDA is not available. Using CPU for processing.")
+
+        if not run_parallel:
+            from marker.models import create_model_dict
+            models_factory = create_model_dict
+
+    if run_pipelined:
+        print(f"Converting {len(queue)} PDFs with the read/convert/write pipeline...")
+        pdf2md.convert_pdfs_pipelined(
+            queue,
+            top_level_output_dir,
+            models_factory=models_factory,
+            batch_multiplier=args.batch_multiplier,
+            max_pages=args.max_pages,
+            langs=args.langs
+        )
+    elif run_parallel:
+        print(f"Converting {len(queue)} PDFs with up to {args.jobs} worker processes...")
+        pdf2md.convert_pdfs(
+            queue,
+            top_level_output_dir,
+            batch_multiplier=args.batch_multiplier,
+            max_pages=args.max_pages,
+            langs=args.langs,
+            jobs=args.jobs
+        )
 
     # --- Processing Loop ---
     for pdf_path in queue:
         print(f"\nProcessing: {pdf_path.name}")
-        
+
         # =========================================================
         # 2. DEFINE A SPECIFIC MARKDOWN DIRECTORY FOR THIS PDF
         #    This is where intermediate files (.md, images) will go.
         # =========================================================
         markdown_dir = top_level_output_dir / pdf_path.stem
-              
+
         try:
-            if not args.skip_md:
+            if not args.skip_md and not run_parallel and not run_pipelined:
                 print("Converting PDF to Markdown...")
                 pdf2md.convert_pdf(
                     input_path=str(pdf_path),
                     output_dir=markdown_dir,
-                    models=models,
+                    models_factory=models_factory,
                     batch_multiplier=args.batch_multiplier,
                     max_pages=args.max_pages,
                     langs=args.langs
                 )
             elif not markdown_dir.exists():
-                print(f"Error: --skip-md was used, but markdown directory not found: {markdown_dir}")
+                print(f"Error: markdown directory not found: {markdown_dir}")
                 continue
 
             if not args.skip_epub:
                 print("Converting Markdown to EPUB...")
                 # The epub module takes the markdown folder and the top-level output folder
-                mark2epub.convert_to_epub(markdown_dir, top_level_output_dir)
+                mark2epub.convert_to_epub(markdown_dir, top_level_output_dir, review=not args.no_review)
                 
         except Exception as e:
             print(f"Error processing {pdf_path.name}: {str(e)}")
@@ -1,6 +1,11 @@
 import markdown
+import io
 import os
-from xml.dom import minidom
+from xml.sax.saxutils import escape
+
+# escape() alone is only safe for element text; values interpolated inside a
+# double-quoted attribute also need '"' escaped, as minidom did
+_ATTR_ENTITIES = {'"': '&quot;'}
 import zipfile
 import sys
 import json
@@ -8,23 +13,53 @@ from PIL import Image
 import regex as re
 from pathlib import Path
 from datetime import datetime
+import concurrent.futures
+import functools
+import shutil
 import subprocess
 from typing import Dict, Optional, Tuple
 
+# Marker can emit very large page scans; don't let Pillow reject them
+Image.MAX_IMAGE_PIXELS = None
+
+# orjson serializes straight to bytes in C; fall back to stdlib json when it
+# isn't installed
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+    _json_loads = json.loads
+
 def get_user_input(prompt: str, default: str = "") -> str:
     """Get user input with a default value."""
-    user_input = input(f"{prompt} [{default}]: ").strip()
+    try:
+        user_input = input(f"{prompt} [{default}]: ").strip()
+    except EOFError:
+        # stdin is closed (CI / piped invocation) — fall back to the default
+        return default
     return user_input if user_input else default
 
-def get_metadata_from_user(existing_metadata: Optional[Dict] = None) -> Dict:
-    """Interactively collect metadata from user with defaults from existing metadata."""
+def get_metadata_from_user(existing_metadata: Optional[Dict] = None, interactive: bool = True) -> Dict:
+    """Collect EPUB metadata, prompting the user unless interactive is False.
+
+    In non-interactive (batch) mode the defaults from any existing metadata
+    are used as-is, so no input() call blocks the pipeline.
+    """
     if existing_metadata is None:
         existing_metadata = {}
-    
+
     metadata = existing_metadata.get("metadata", {})
-    
-    print("\nPlease provide the following metadata for your EPUB (press Enter to use default value):")
-    
+
+    if interactive:
+        print("\nPlease provide the following metadata for your EPUB (press Enter to use default value):")
+
     fields = {
         "dc:title": ("Title", metadata.get("dc:title", "Untitled Document")),
         "dc:creator": ("Author(s)", metadata.get("dc:creator", "Unknown Author")),
@@ -37,7 +72,7 @@ def get_metadata_from_user(existing_metadata: Optional[Dict] = None) -> Dict:
     
     updated_metadata = {}
     for key, (prompt, default) in fields.items():
-        value = get_user_input(prompt, default)
+        value = get_user_input(prompt, default) if interactive else default
         updated_metadata[key] = value
         
     return {
@@ -73,168 +108,201 @@ def review_markdown(markdown_path: Path) -> tuple[bool, str]:
         else:
             print("Please enter 'y' or 'n'")
 
-def process_markdown_for_images(markdown_text: str, work_dir: Path) -> tuple[str, list[str]]:
-    """Process markdown content to find image references."""
-    image_pattern = r'!\[(.*?)\]\((.*?)\)'
+# Compiled once at import time; used for every chapter. Negated character
+# classes instead of lazy .*? keep matching linear-time even on malformed
+# markdown (long runs of '[' or '(' cannot trigger catastrophic backtracking).
+_IMG_RE = re.compile(r'!\[([^\]\n]*)\]\(([^)\n]*)\)')
+_NL_RE = re.compile(r'\n+')
+
+# Single source of truth for the image formats we package: the OPF media-type
+# lookup and the directory extension filters are derived from the same table.
+_IMAGE_MEDIA_TYPES = {
+    ".gif": "image/gif",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+}
+_IMAGE_EXTENSIONS = [suffix.lstrip('.') for suffix in _IMAGE_MEDIA_TYPES]
+
+def list_image_names(images_dir) -> frozenset:
+    """Snapshot the names in an images directory; empty set if it is missing."""
+    try:
+        return frozenset(entry.name for entry in os.scandir(images_dir))
+    except FileNotFoundError:
+        return frozenset()
+
+def process_markdown_for_images(markdown_text: str, work_dir: Path,
+                                available_images: Optional[frozenset] = None) -> tuple[str, list[str]]:
+    """Process markdown content to find image references.
+
+    Callers processing many chapters should pass a shared `available_images`
+    snapshot so each match is a set lookup instead of a stat() syscall.
+    """
+    images_dir = work_dir / 'images'
+    if available_images is None:
+        available_images = list_image_names(images_dir)
+
     images_found = []
-    modified_text = markdown_text
-    
-    for match in re.finditer(image_pattern, markdown_text):
+
+    def _repl(match):
         alt_text, image_path = match.groups()
-        image_path = image_path.strip()
-        img_path = Path(image_path)
-        
-        # Correctly find the image in the 'images' subdirectory
-        full_image_path = work_dir / 'images' / img_path.name
-        if full_image_path.exists():
-            images_found.append(img_path.name)
+        image_name = Path(image_path.strip()).name
+        if image_name in available_images:
+            images_found.append(image_name)
             # Ensure the new reference points to the 'images' folder in the EPUB
-            new_ref = f'![{alt_text}](images/{img_path.name})'
-            modified_text = modified_text.replace(match.group(0), new_ref)
-        else:
-            print(f"Warning: Image not found: {full_image_path}")
-    
+            return f'![{alt_text}](images/{image_name})'
+        print(f"Warning: Image not found: {images_dir / image_name}")
+        return match.group(0)
+
+    # Single linear pass instead of a full-text str.replace per image; this also
+    # avoids accidentally rewriting identical earlier occurrences
+    modified_text = _IMG_RE.sub(_repl, markdown_text)
     return modified_text, images_found
 
-def copy_and_optimize_image(src_path: Path, dest_path: Path, max_dimension: int = 1800) -> None:
-    """Copy image to destination path with optimization for EPUB."""
+def optimize_image_bytes(src_path: Path, max_dimension: int = 1800) -> tuple[str, bytes]:
+    """Optimize an image for EPUB, returning (filename, encoded bytes).
+
+    Returning bytes instead of writing to disk lets callers encode many
+    images concurrently and serialize only the final zip write.
+    """
     try:
+        dest_name = src_path.name
+        suffix = src_path.suffix.lower()
+        is_jpeg = suffix in ('.jpg', '.jpeg')
+
+        # Header-only probe: Image.open reads metadata without decoding pixels
+        with Image.open(src_path) as probe:
+            width, height = probe.size
+            mode = probe.mode
+
+        # Other formats (e.g. gif) are kept as-is so manifest names stay valid,
+        # and correctly-sized RGB images need no work at all; returning None
+        # tells the caller to stream the source file directly, skipping the
+        # decode + re-encode round-trip entirely.
+        needs_work = max(width, height) > max_dimension or mode == 'RGBA'
+        if suffix not in ('.jpg', '.jpeg', '.png') or not needs_work:
+            return dest_name, None
+
         with Image.open(src_path) as img:
+            if is_jpeg:
+                # Let libjpeg downscale during decode when a resize is coming
+                img.draft('JPEG', (max_dimension, max_dimension))
+
             if img.mode == 'RGBA':
                 img = img.convert('RGB')
-                
+
             ratio = min(max_dimension / max(img.size[0], img.size[1]), 1.0)
             new_size = tuple(int(dim * ratio) for dim in img.size)
-            
+
             if ratio < 1.0:
                 img = img.resize(new_size, Image.Resampling.LANCZOS)
-            
-            if src_path.suffix.lower() in ['.jpg', '.jpeg']:
-                img.save(dest_path, 'JPEG', quality=85, optimize=True)
-            elif src_path.suffix.lower() == '.png':
-                img.save(dest_path, 'PNG', optimize=True)
-            else:
-                dest_path = dest_path.with_suffix('.jpg')
-                img.save(dest_path, 'JPEG', quality=85, optimize=True)
-                
-    except Exception as e:
-        print(f"Error processing image {src_path}: {e}")
-        raise
 
-def get_all_filenames(the_dir, extensions=[]):
-    if not os.path.exists(the_dir):
-        return []
-    all_files = [x for x in os.listdir(the_dir)]
-    all_files = [x for x in all_files if x.split(".")[-1] in extensions]
-    return all_files
-
-def get_packageOPF_XML(md_filenames=[], image_filenames=[], css_filenames=[], description_data=None):
-    doc = minidom.Document()
+            buf = io.BytesIO()
+            if is_jpeg:
+                img.save(buf, 'JPEG', quality=85, optimize=True)
+            else:
+                img.save(buf, 'PNG', optimize=True)
 
-    package = doc.createElement('package')
-    package.setAttribute('xmlns',"http://www.idpf.org/2007/opf")
-    package.setAttribute('version',"3.0")
-    package.setAttribute('xml:lang',"en")
-    package.setAttribute("unique-identifier","pub-id")
+            return dest_name, buf.getvalue()
 
-    # Now building the metadata
-    metadata = doc.createElement('metadata')
-    metadata.setAttribute('xmlns:dc', 'http://purl.org/dc/elements/1.1/')
+    except Exception as e:
+        # A single undecodable image shouldn't kill the whole EPUB build;
+        # fall back to streaming the original bytes, as before optimization
+        print(f"Warning: could not optimize image {src_path}, copying as-is: {e}")
+        return src_path.name, None
+
+def stream_file_into_epub(epub: zipfile.ZipFile, arcname: str, src_path: Path,
+                          compress_type: int = zipfile.ZIP_DEFLATED) -> None:
+    """Copy a file into the EPUB through a fixed-size buffer.
+
+    Avoids materializing the whole file as a bytes object the way
+    writestr(f.read()) does, so peak memory stays flat regardless of
+    image size.
+    """
+    zi = zipfile.ZipInfo(arcname)
+    zi.compress_type = compress_type
+    with epub.open(zi, 'w', force_zip64=True) as dst, open(src_path, 'rb') as src:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def get_all_filenames(the_dir, extensions=(), names=None):
+    exts = {e.lower() if e.startswith('.') else '.' + e.lower() for e in extensions}
+    if names is None:
+        try:
+            # DirEntry.is_file() uses the type info cached from the directory
+            # read, so this is one pass with no extra stat per entry
+            with os.scandir(the_dir) as it:
+                names = [e.name for e in it if e.is_file()]
+        except FileNotFoundError:
+            return []
+    # Sorting keeps the manifest order deterministic instead of depending on
+    # filesystem directory order
+    return sorted(n for n in names if Path(n).suffix.lower() in exts)
+
+def get_packageOPF_XML(md_stems=[], image_filenames=[], css_filenames=[], description_data=None):
+    # Direct string templating (like get_TOC_XML/get_TOCNCX_XML below) instead of
+    # building a minidom tree and pretty-printing it: far fewer allocations and
+    # no re-parse/re-serialize pass for books with many manifest items.
+    metadata_id_attrs = {
+        "dc:title": ' id="title"',
+        "dc:creator": ' id="creator"',
+        "dc:identifier": ' id="book-id"',
+    }
 
-    for k,v in description_data["metadata"].items():
+    metadata_lines = []
+    for k, v in description_data["metadata"].items():
         if len(v):
-            x = doc.createElement(k)
-            for metadata_type,id_label in [("dc:title","title"),("dc:creator","creator"),("dc:identifier","book-id")]:
-                if k==metadata_type:
-                    x.setAttribute('id',id_label)
-            x.appendChild(doc.createTextNode(v))
-            metadata.appendChild(x)
-
-    # Now building the manifest
-    manifest = doc.createElement('manifest')
-
-    # TOC.xhtml file for EPUB 3
-    x = doc.createElement('item')
-    x.setAttribute('id',"toc")
-    x.setAttribute('properties',"nav")
-    x.setAttribute('href',"TOC.xhtml")
-    x.setAttribute('media-type',"application/xhtml+xml")
-    manifest.appendChild(x)
-
-    # Ensure retrocompatibility by also providing a TOC.ncx file
-    x = doc.createElement('item')
-    x.setAttribute('id',"ncx")
-    x.setAttribute('href',"toc.ncx")
-    x.setAttribute('media-type',"application/x-dtbncx+xml")
-    manifest.appendChild(x)
-
-    x = doc.createElement('item')
-    x.setAttribute('id',"titlepage")
-    x.setAttribute('href',"titlepage.xhtml")
-    x.setAttribute('media-type',"application/xhtml+xml")
-    manifest.appendChild(x)
-
-    for i,md_filename in enumerate(md_filenames):
-        x = doc.createElement('item')
-        x.setAttribute('id',"s{:05d}".format(i))
-        x.setAttribute('href',"s{:05d}-{}.xhtml".format(i,md_filename.split(".")[0]))
-        x.setAttribute('media-type',"application/xhtml+xml")
-        manifest.appendChild(x)
-
-    for i,image_filename in enumerate(image_filenames):
-        x = doc.createElement('item')
-        x.setAttribute('id',"image-{:05d}".format(i))
-        x.setAttribute('href',"images/{}".format(image_filename))
-        if "gif" in image_filename:
-            x.setAttribute('media-type',"image/gif")
-        elif "jpg" in image_filename or "jpeg" in image_filename:
-            x.setAttribute('media-type',"image/jpeg")
-        elif "png" in image_filename:
-            x.setAttribute('media-type',"image/png")
-        if image_filename==description_data.get("cover_image"):
-            x.setAttribute('properties',"cover-image")
+            attr = metadata_id_attrs.get(k, "")
+            metadata_lines.append(f'<{k}{attr}>{escape(v)}</{k}>\n')
+
+    manifest_lines = [
+        # TOC.xhtml file for EPUB 3
+        '<item id="toc" properties="nav" href="TOC.xhtml" media-type="application/xhtml+xml"/>\n',
+        # Ensure retrocompatibility by also providing a TOC.ncx file
+        '<item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>\n',
+        '<item id="titlepage" href="titlepage.xhtml" media-type="application/xhtml+xml"/>\n',
+    ]
+    spine_lines = [
+        '<itemref idref="titlepage" linear="yes"/>\n',
+    ]
+
+    # One pass over the chapters builds both the manifest item and its spine entry
+    for i, stem in enumerate(md_stems):
+        manifest_lines.append(
+            f'<item id="s{i:05d}" href="s{i:05d}-{stem}.xhtml" media-type="application/xhtml+xml"/>\n'
+        )
+        spine_lines.append(f'<itemref idref="s{i:05d}" linear="yes"/>\n')
+
+    for i, image_filename in enumerate(image_filenames):
+        media_type = _IMAGE_MEDIA_TYPES.get(Path(image_filename).suffix.lower())
+        media_type_attr = f' media-type="{media_type}"' if media_type else ""
+        properties_attr = ""
+        if image_filename == description_data.get("cover_image"):
+            properties_attr = ' properties="cover-image"'
             # Ensure compatibility by also providing a meta tag in the metadata
-            y = doc.createElement('meta')
-            y.setAttribute('name',"cover")
-            y.setAttribute('content',"image-{:05d}".format(i))
-            metadata.appendChild(y)
-        manifest.appendChild(x)
-
-    for i,css_filename in enumerate(css_filenames):
-        x = doc.createElement('item')
-        x.setAttribute('id',"css-{:05d}".format(i))
-        x.setAttribute('href',"css/{}".format(css_filename))
-        x.setAttribute('media-type',"text/css")
-        manifest.appendChild(x)
-
-    # Now building the spine
-    spine = doc.createElement('spine')
-    spine.setAttribute('toc', "ncx")
-
-    x = doc.createElement('itemref')
-    x.setAttribute('idref',"titlepage")
-    x.setAttribute('linear',"yes")
-    spine.appendChild(x)
-    for i,md_filename in enumerate(md_filenames):
-        x = doc.createElement('itemref')
-        x.setAttribute('idref',"s{:05d}".format(i))
-        x.setAttribute('linear',"yes")
-        spine.appendChild(x)
-
-    guide = doc.createElement('guide')
-    x = doc.createElement('reference')
-    x.setAttribute('type',"cover")
-    x.setAttribute('title',"Cover image")
-    x.setAttribute('href',"titlepage.xhtml")
-    guide.appendChild(x)
-
-    package.appendChild(metadata)
-    package.appendChild(manifest)
-    package.appendChild(spine)
-    package.appendChild(guide)
-    doc.appendChild(package)
-
-    return doc.toprettyxml()
+            metadata_lines.append(f'<meta name="cover" content="image-{i:05d}"/>\n')
+        manifest_lines.append(
+            f'<item id="image-{i:05d}" href="images/{escape(image_filename, _ATTR_ENTITIES)}"{media_type_attr}{properties_attr}/>\n'
+        )
+
+    for i, css_filename in enumerate(css_filenames):
+        manifest_lines.append(
+            f'<item id="css-{i:05d}" href="css/{escape(css_filename, _ATTR_ENTITIES)}" media-type="text/css"/>\n'
+        )
+
+    return f"""<?xml version="1.0" ?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0" xml:lang="en" unique-identifier="pub-id">
+<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+{''.join(metadata_lines)}</metadata>
+<manifest>
+{''.join(manifest_lines)}</manifest>
+<spine toc="ncx">
+{''.join(spine_lines)}</spine>
+<guide>
+<reference type="cover" title="Cover image" href="titlepage.xhtml"/>
+</guide>
+</package>
+""".encode('utf-8')
 
 def get_container_XML():
     return """<?xml version="1.0" encoding="UTF-8" ?>
@@ -242,7 +310,7 @@ def get_container_XML():
 <rootfiles>
 <rootfile full-path="OPS/package.opf" media-type="application/oebps-package+xml"/>
 </rootfiles>
-</container>"""
+</container>""".encode('utf-8')
 
 def get_coverpage_XML(title, authors):
     return f"""<?xml version="1.0" encoding="utf-8"?>
@@ -285,9 +353,9 @@ p {{
         <p>{authors}</p>
     </div>
 </body>
-</html>"""
+</html>""".encode('utf-8')
 
-def get_TOC_XML(default_css_filenames, markdown_filenames):
+def get_TOC_XML(default_css_filenames, markdown_stems):
     toc_xhtml = """<?xml version="1.0" encoding="UTF-8"?>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" lang="en">
 <head>
@@ -301,35 +369,70 @@ def get_TOC_XML(default_css_filenames, markdown_filenames):
 <nav epub:type="toc" role="doc-toc" id="toc">
 <h2>Contents</h2>
 <ol epub:type="list">"""
-    for i,md_filename in enumerate(markdown_filenames):
-        toc_xhtml += f"""<li><a href="s{i:05d}-{md_filename.split(".")[0]}.xhtml">{md_filename.split(".")[0]}</a></li>"""
+    for i,stem in enumerate(markdown_stems):
+        toc_xhtml += f"""<li><a href="s{i:05d}-{stem}.xhtml">{stem}</a></li>"""
     toc_xhtml += """</ol>
 </nav>
 </body>
 </html>"""
-    return toc_xhtml
+    return toc_xhtml.encode('utf-8')
 
-def get_TOCNCX_XML(markdown_filenames):
+def get_TOCNCX_XML(markdown_stems):
     toc_ncx = """<?xml version="1.0" encoding="UTF-8"?>
 <ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" xml:lang="fr" version="2005-1">
 <head>
 </head>
 <navMap>
 """
-    for i,md_filename in enumerate(markdown_filenames):
+    for i,stem in enumerate(markdown_stems):
         toc_ncx += f"""<navPoint id="navpoint-{i}">
 <navLabel>
-<text>{md_filename.split(".")[0]}</text>
-</navLabel><content src="s{i:05d}-{md_filename.split(".")[0]}.xhtml"/>
+<text>{stem}</text>
+</navLabel><content src="s{i:05d}-{stem}.xhtml"/>
 </navPoint>"""
     toc_ncx += """</navMap>
 </ncx>"""
-    return toc_ncx
+    return toc_ncx.encode('utf-8')
+
+_MARKDOWN_EXTENSIONS = ("codehilite", "tables", "fenced_code", "footnotes")
+_MARKDOWN_EXTENSION_CONFIGS = {"codehilite": {"guess_lang": False}}
 
-def get_chapter_XML(work_dir: str, md_filename: str, css_filenames: list[str], content: Optional[str] = None) -> tuple[str, list[str]]:
+@functools.lru_cache(maxsize=None)
+def make_markdown_converter(extensions: tuple = _MARKDOWN_EXTENSIONS) -> markdown.Markdown:
+    """Build (and cache) a reusable Markdown converter for an extension set.
+
+    Caching per combination means a whole book instantiates only a handful
+    of Markdown objects no matter how many chapters it has.
+    """
+    return markdown.Markdown(
+        extensions=list(extensions),
+        extension_configs={k: v for k, v in _MARKDOWN_EXTENSION_CONFIGS.items() if k in extensions}
+    )
+
+def select_markdown_extensions(text: str) -> tuple:
+    """Pick only the extensions a chapter can actually trigger.
+
+    codehilite pulls in Pygments and runs detection on every paragraph, and
+    tables/footnotes likewise scan the whole text, so marker output without
+    code blocks, pipes or footnote markers skips them entirely.
+    """
+    extensions = []
+    if '```' in text or '\n    ' in text:
+        extensions.extend(("codehilite", "fenced_code"))
+    if '|' in text:
+        extensions.append("tables")
+    if '[^' in text:
+        extensions.append("footnotes")
+    return tuple(extensions)
+
+def get_chapter_XML(work_dir: str, md_filename: str, css_filenames: list[str], content: Optional[str] = None, md: Optional[markdown.Markdown] = None, available_images: Optional[frozenset] = None) -> tuple[str, list[str]]:
     """
     Convert markdown chapter to XHTML and process images.
     Returns tuple of (XHTML content, list of images referenced in chapter)
+
+    Pass a shared `md` converter when processing many chapters; building a
+    Markdown instance registers extensions and compiles dozens of regexes,
+    which is worth amortizing across the whole book.
     """
     work_dir_path = Path(work_dir)
     
@@ -338,29 +441,29 @@ def get_chapter_XML(work_dir: str, md_filename: str, css_filenames: list[str], c
     else:
         markdown_data = content
     
-    # ==================== ADD THIS FIX ====================
     # Preprocess the markdown to ensure paragraphs are separated by blank lines.
-    # This forces the markdown converter to wrap each line in a <p> tag.
-    lines = markdown_data.strip().split('\n')
-    corrected_markdown = "\n\n".join(lines)
-    # ======================================================
+    # This forces the markdown converter to wrap each line in a <p> tag. A single
+    # regex pass runs in C (no per-line list of str objects) and collapsing runs
+    # of newlines avoids turning existing blank separators into \n\n\n\n.
+    corrected_markdown = _NL_RE.sub('\n\n', markdown_data.strip())
 
     # Process the corrected markdown for images and get list of referenced images
-    final_markdown, chapter_images = process_markdown_for_images(corrected_markdown, work_dir_path)
+    final_markdown, chapter_images = process_markdown_for_images(
+        corrected_markdown, work_dir_path, available_images=available_images
+    )
     
     # Convert the fully processed markdown to HTML
-    html_text = markdown.markdown(
-        final_markdown,
-        extensions=["codehilite", "tables", "fenced_code", "footnotes"],
-        extension_configs={"codehilite": {"guess_lang": False}}
-    )
+    if md is None:
+        md = make_markdown_converter(select_markdown_extensions(final_markdown))
+    md.reset()
+    html_text = md.convert(final_markdown)
 
     # Generate XHTML wrapper
     xhtml = f"""<?xml version="1.0" encoding="UTF-8"?>
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" lang="en">
 <head>
     <meta http-equiv="default-style" content="text/html; charset=utf-8"/>
-    <title>{md_filename.split(".")[0]}</title>
+    <title>{Path(md_filename).stem}</title>
     {''.join(f'<link rel="stylesheet" href="css/{css}" type="text/css" media="all"/>' for css in css_filenames)}
 </head>
 <body>
@@ -370,18 +473,29 @@ def get_chapter_XML(work_dir: str, md_filename: str, css_filenames: list[str], c
 
     return xhtml, chapter_images
 
-def convert_to_epub(markdown_dir: Path, output_dir: Path) -> None:
+def _render_chapter(task) -> tuple[str, list[str]]:
+    """Render one chapter from a picklable task tuple.
+
+    Module-level so ProcessPoolExecutor can dispatch it to workers; the
+    serial path maps over it with the same signature. Converter reuse is
+    handled by the per-process make_markdown_converter cache.
+    """
+    work_dir, md_filename, css_filenames, content, available_images = task
+    return get_chapter_XML(work_dir, md_filename, css_filenames, content=content,
+                           available_images=available_images)
+
+def convert_to_epub(markdown_dir: Path, output_dir: Path, review: bool = True) -> None:
     if not markdown_dir.exists():
         raise FileNotFoundError(f"Markdown directory not found: {markdown_dir}")
-        
+
     if not list(markdown_dir.glob('*.md')):
         raise ValueError(f"No markdown files found in: {markdown_dir}")
-    
+
     # The final EPUB will be placed in the parent output_dir, named after the markdown_dir
     epub_path = output_dir / f"{markdown_dir.name}.epub"
-    main([str(markdown_dir), str(epub_path)])
+    main([str(markdown_dir), str(epub_path)], review=review)
 
-def main(args):
+def main(args, review: bool = True):
     if len(args) < 2:
         print("\nUsage:\n    python md2epub.py <markdown_directory> <output_file.epub>")
         exit(1)
@@ -419,13 +533,12 @@ h1, h2, h3, h4 {
     css_dir = str(css_dir_path)
 
     try:
-        description_path = os.path.join(work_dir, "description.json")
+        description_path = Path(work_dir) / "description.json"
         existing_metadata = {}
-        if os.path.exists(description_path):
-            with open(description_path, 'r', encoding='utf-8') as f:
-                existing_metadata = json.load(f)
+        if description_path.exists():
+            existing_metadata = _json_loads(description_path.read_bytes())
         
-        json_data = get_metadata_from_user(existing_metadata)
+        json_data = get_metadata_from_user(existing_metadata, interactive=review)
         
         # == CHANGE 2: Ensure our stylesheet is always included ==
         if "stylesheet.css" not in json_data.get("default_css", []):
@@ -439,88 +552,125 @@ h1, h2, h3, h4 {
             for md_file in sorted(markdown_files):
                 json_data["chapters"].append({"markdown": md_file, "css": ""})
         
-        with open(description_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2)
+        description_path.write_bytes(_json_dumps(json_data))
         
+        # When review is disabled, chapters are read exactly once — inside
+        # get_chapter_XML — instead of here and then again during rendering
         chapter_contents = {}
-        for chapter in json_data["chapters"]:
-            md_path = Path(work_dir) / chapter["markdown"]
-            should_continue, content = review_markdown(md_path)
-            if not should_continue:
-                print("\nConversion aborted by user.")
-                return
-            chapter_contents[chapter["markdown"]] = content
+        if review:
+            for chapter in json_data["chapters"]:
+                md_path = Path(work_dir) / chapter["markdown"]
+                should_continue, content = review_markdown(md_path)
+                if not should_continue:
+                    print("\nConversion aborted by user.")
+                    return
+                chapter_contents[chapter["markdown"]] = content
 
         title = json_data["metadata"].get("dc:title", "Untitled Document")
         authors = json_data["metadata"].get("dc:creator", "Unknown Author")
 
         all_md_filenames = [ch["markdown"] for ch in json_data["chapters"]]
+        # Compute each chapter stem once; Path.stem is also robust to filenames
+        # with multiple dots (chapter.01.md), unlike split(".")[0]
+        all_md_stems = [Path(f).stem for f in all_md_filenames]
         all_css_filenames = list(dict.fromkeys(json_data["default_css"]))
 
-        # Process chapters to find all referenced images
-        all_referenced_images = set()
-        chapter_data = {}
-        print("\nProcessing chapters and collecting image references...")
-        for chapter in json_data["chapters"]:
-            md_filename = chapter["markdown"]
-            css_files = json_data["default_css"]
-            chapter_xhtml, chapter_images = get_chapter_XML(
-                work_dir, md_filename, css_files, content=chapter_contents[md_filename]
-            )
-            chapter_data[md_filename] = chapter_xhtml
-            all_referenced_images.update(chapter_images)
-            
+        # One directory snapshot shared by chapter processing and the zip writes
+        available_images = list_image_names(images_dir)
+
+        # Resolve the CSS files once up front instead of re-statting the
+        # directory and every file inside the zip-writing section
+        css_entries = [
+            (f"OPS/css/{css}", css_dir_path / css)
+            for css in all_css_filenames
+            if (css_dir_path / css).is_file()
+        ]
+
         print("\nCreating EPUB file...")
-        with zipfile.ZipFile(output_path, "w") as epub:
+        # One deflate configuration for the whole archive: compresslevel=1 is
+        # plenty for text entries (XHTML/CSS/OPF deflate to ~10% of original at
+        # any level) and much cheaper than the default 6. Individual entries
+        # only override this for the spec-mandated stored mimetype and for
+        # already-compressed images.
+        with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as epub:
+            # The mimetype entry must be stored uncompressed per the EPUB spec
             epub.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
-            epub.writestr("META-INF/container.xml", get_container_XML(), compress_type=zipfile.ZIP_DEFLATED)
+            epub.writestr("META-INF/container.xml", get_container_XML())
             
             # Get list of all images available in the images directory
-            all_available_images = get_all_filenames(images_dir, extensions=["gif", "jpg", "jpeg", "png"])
+            all_available_images = get_all_filenames(images_dir, extensions=_IMAGE_EXTENSIONS,
+                                                     names=available_images)
             
-            epub.writestr("OPS/package.opf", 
+            epub.writestr("OPS/package.opf",
                 get_packageOPF_XML(
-                    md_filenames=all_md_filenames,
+                    md_stems=all_md_stems,
                     image_filenames=all_available_images,
                     css_filenames=all_css_filenames,
                     description_data=json_data
-                ), 
-                compress_type=zipfile.ZIP_DEFLATED
+                )
             )
-            epub.writestr("OPS/titlepage.xhtml", get_coverpage_XML(title, authors).encode('utf-8'), compress_type=zipfile.ZIP_DEFLATED)
+            epub.writestr("OPS/titlepage.xhtml", get_coverpage_XML(title, authors))
             
+            # Render each chapter and write it immediately rather than holding
+            # every chapter's XHTML in memory at once; the OPF above only needs
+            # the filename list, so there is no ordering constraint.
             print("Writing chapters...")
-            for i, md_filename in enumerate(all_md_filenames):
-                epub.writestr(
-                    f"OPS/s{i:05d}-{md_filename.split('.')[0]}.xhtml",
-                    chapter_data[md_filename].encode('utf-8'),
-                    compress_type=zipfile.ZIP_DEFLATED
-                )
+            all_referenced_images = set()
+            css_files = json_data["default_css"]
+            tasks = [
+                (work_dir, md_filename, css_files, chapter_contents.get(md_filename), available_images)
+                for md_filename in all_md_filenames
+            ]
+            # Markdown parsing is pure-Python and GIL-bound, so large books
+            # spread chapters across a process pool; Executor.map yields in
+            # submission order, which keeps the streaming zip writes valid.
+            # For tiny books the spawn overhead isn't worth it.
+            pool = concurrent.futures.ProcessPoolExecutor() if len(tasks) > 2 else None
+            rendered = pool.map(_render_chapter, tasks) if pool else map(_render_chapter, tasks)
+            try:
+                for i, (stem, (chapter_xhtml, chapter_images)) in enumerate(zip(all_md_stems, rendered)):
+                    epub.writestr(
+                        f"OPS/s{i:05d}-{stem}.xhtml",
+                        chapter_xhtml.encode('utf-8')
+                    )
+                    all_referenced_images.update(chapter_images)
+            finally:
+                if pool:
+                    pool.shutdown()
             
             if all_available_images:
                 print(f"Writing {len(all_available_images)} images...")
-                for image_name in all_available_images:
-                    src_path = Path(images_dir) / image_name
-                    with open(src_path, "rb") as f:
-                        epub.writestr(f"OPS/images/{image_name}", f.read(), compress_type=zipfile.ZIP_DEFLATED)
+                # Encode/optimize images on all cores (Pillow releases the GIL in
+                # its C encoders); the ZipFile itself is not thread-safe, so only
+                # the final writestr happens on the main thread.
+                with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                    futures = [
+                        pool.submit(optimize_image_bytes, Path(images_dir) / image_name)
+                        for image_name in all_available_images
+                    ]
+                    for future in concurrent.futures.as_completed(futures):
+                        image_name, image_data = future.result()
+                        # JPEG/PNG/GIF payloads are already entropy-coded;
+                        # re-deflating them burns CPU for <1% size reduction
+                        ext = Path(image_name).suffix.lower()
+                        compress_type = (
+                            zipfile.ZIP_STORED if ext in _IMAGE_MEDIA_TYPES
+                            else zipfile.ZIP_DEFLATED
+                        )
+                        if image_data is None:
+                            stream_file_into_epub(epub, f"OPS/images/{image_name}",
+                                                  Path(images_dir) / image_name, compress_type)
+                        else:
+                            epub.writestr(f"OPS/images/{image_name}", image_data, compress_type=compress_type)
 
             print("Writing table of contents...")
-            epub.writestr("OPS/TOC.xhtml", 
-                get_TOC_XML(all_css_filenames, all_md_filenames).encode('utf-8'),
-                compress_type=zipfile.ZIP_DEFLATED
-            )
-            epub.writestr("OPS/toc.ncx",
-                get_TOCNCX_XML(all_md_filenames).encode('utf-8'),
-                compress_type=zipfile.ZIP_DEFLATED
-            )
+            epub.writestr("OPS/TOC.xhtml", get_TOC_XML(all_css_filenames, all_md_stems))
+            epub.writestr("OPS/toc.ncx", get_TOCNCX_XML(all_md_stems))
             
-            if os.path.exists(css_dir):
-                print(f"Writing {len(all_css_filenames)} CSS files...")
-                for css in all_css_filenames:
-                    css_path = os.path.join(css_dir, css)
-                    if os.path.exists(css_path):
-                        with open(css_path, "rb") as f:
-                            epub.writestr(f"OPS/css/{css}", f.read(), compress_type=zipfile.ZIP_DEFLATED)
+            if css_entries:
+                print(f"Writing {len(css_entries)} CSS files...")
+                for arcname, src_path in css_entries:
+                    stream_file_into_epub(epub, arcname, src_path)
 
         print(f"\nEPUB creation complete: {output_path}")
         
@@ -1,21 +1,37 @@
 import argparse
 from pathlib import Path
+import asyncio
+import concurrent.futures
+import functools
+import multiprocessing
+import os
+import shutil
 import sys
 import json
-from marker.config.parser import ConfigParser
-from marker.output import save_output
-from marker.models import create_model_dict # Already added, but for context
-from marker.config.parser import ConfigParser
-from marker.renderers.markdown import MarkdownOutput
-from marker.renderers.html import HTMLOutput
-from marker.renderers.json import JSONOutput
-from marker.renderers.chunk import ChunkOutput
-from marker.renderers.ocr_json import OCRJSONOutput
-from marker.renderers.extraction import ExtractionOutput
-from marker.settings import settings
 from PIL import Image
+import numpy as np
 import io
 
+# marker is deliberately NOT imported at module level: marker.settings does
+# `import torch` on import, so keeping it out of our import path is what lets
+# --help and EPUB-only (--skip-md) runs skip the multi-second torch startup.
+# Every function that needs marker imports it on first use instead.
+
+# orjson serializes straight to bytes in C (including numpy values from
+# marker's per-page metadata); fall back to stdlib json when not installed
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+    _HAS_ORJSON = True
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+    _HAS_ORJSON = False
+
 def get_default_output_dir(input_path: Path) -> Path:
     """
     Generate default output directory path based on input PDF path.
@@ -33,11 +49,69 @@ def get_default_input_dir() -> Path:
     return input_dir
 
 
+# Directories this process has already created; each mkdir(exist_ok=True) on
+# an existing path still costs a syscall, which adds up across batch runs
+_created_dirs = set()
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (with parents) at most once per process."""
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
+
+def _bytes_match_suffix(data: bytes, suffix: str) -> bool:
+    """Check whether an image payload's magic bytes already match a filename suffix."""
+    if suffix in ('.jpg', '.jpeg'):
+        return data[:3] == b'\xff\xd8\xff'
+    if suffix == '.png':
+        return data[:4] == b'\x89PNG'
+    if suffix == '.gif':
+        return data[:4] == b'GIF8'
+    if suffix == '.webp':
+        return data[:4] == b'RIFF' and data[8:12] == b'WEBP'
+    return False
+
+
+def _save_pil_image(image_path: Path, image_data: Image.Image) -> bool:
+    image_data.save(image_path)
+    return True
+
+def _save_bytes_image(image_path: Path, image_data: bytes) -> bool:
+    # If the payload is already in the target format, write the bytes straight
+    # through; decoding and re-encoding identical data is pure CPU waste
+    if _bytes_match_suffix(image_data, image_path.suffix.lower()):
+        image_path.write_bytes(image_data)
+    else:
+        Image.open(io.BytesIO(image_data)).save(image_path)
+    return True
+
+def _save_path_image(image_path: Path, image_data: str) -> bool:
+    if not Path(image_data).exists():
+        print(f"Image path does not exist: {image_data}")
+        return False
+    # The source file is already encoded on disk — copy it (hardlink when on
+    # the same filesystem) instead of round-tripping through PIL
+    try:
+        os.link(image_data, image_path)
+    except OSError:
+        shutil.copyfile(image_data, image_path)
+    return True
+
+# Indexed by concrete type; a single conversion emits a homogeneous batch, so
+# after the first lookup every image dispatches with one dict access
+_IMAGE_SAVERS = {
+    Image.Image: _save_pil_image,
+    bytes: _save_bytes_image,
+    str: _save_path_image,
+}
+
+
 def save_images(images: dict, image_dir: Path) -> None:
     """
     Save images with proper error handling and format detection.
     Preserves original image filenames from the input.
-    
+
     Args:
         images: Dictionary of images from marker-pdf conversion where keys are filenames
         image_dir: Directory to save images to
@@ -45,64 +119,157 @@ def save_images(images: dict, image_dir: Path) -> None:
     if not images:
         print("No images found in document")
         return
-        
-    image_dir.mkdir(exist_ok=True)
+
+    _ensure_dir(image_dir)
     saved_count = 0
-    
+
     for filename, image_data in images.items():
         try:
             # Skip if image data is None or empty
             if not image_data:
                 continue
-                
+
             image_path = image_dir / filename
-            
-            # Handle different image data formats
-            if isinstance(image_data, Image.Image):
-                image_data.save(image_path)
-                saved_count += 1
-                    
-            elif isinstance(image_data, bytes):
-                img = Image.open(io.BytesIO(image_data))
-                img.save(image_path)
-                saved_count += 1
-                    
-            elif isinstance(image_data, str):
-                if Path(image_data).exists():
-                    img = Image.open(image_data)
-                    img.save(image_path)
-                    saved_count += 1
-                else:
-                    print(f"Image path does not exist: {image_data}")
-            else:
+
+            saver = _IMAGE_SAVERS.get(type(image_data))
+            if saver is None:
+                # Exact type missed (e.g. a PIL subclass like PngImageFile);
+                # resolve via isinstance once and remember the concrete type
+                for cls, candidate in list(_IMAGE_SAVERS.items()):
+                    if isinstance(image_data, cls):
+                        saver = candidate
+                        _IMAGE_SAVERS[type(image_data)] = candidate
+                        break
+
+            if saver is None:
                 print(f"Unsupported image data type for {filename}: {type(image_data)}")
-                
+                continue
+
+            if saver(image_path, image_data):
+                saved_count += 1
+
         except Exception as e:
             print(f"Error saving image {filename}: {str(e)}")
             continue
-            
+
     if saved_count > 0:
         print(f"Successfully saved {saved_count} images to: {image_dir}")
     else:
         print("No valid images were found to save")
 
 
+def _markdown_output(rendered):
+    return rendered.markdown, "md", rendered.images
+
+def _html_output(rendered):
+    return rendered.html, "html", rendered.images
+
+def _json_output(rendered):
+    if _HAS_ORJSON:
+        # orjson on the plain dict skips Pydantic's slower JSON path;
+        # mode="json" makes pydantic coerce enums/custom types to JSON-native
+        # values orjson can serialize
+        return _json_dumps(rendered.model_dump(mode="json", exclude={"metadata"})).decode(), "json", {}
+    return rendered.model_dump_json(exclude=["metadata"], indent=2), "json", {}
+
+# One dict lookup on the exact type replaces walking an isinstance chain for
+# every converted document; built on first use so importing this module
+# doesn't drag in marker (and torch)
+@functools.lru_cache(maxsize=1)
+def _rendered_handlers() -> dict:
+    from marker.renderers.markdown import MarkdownOutput
+    from marker.renderers.html import HTMLOutput
+    from marker.renderers.json import JSONOutput
+    from marker.renderers.chunk import ChunkOutput
+    from marker.renderers.ocr_json import OCRJSONOutput
+    from marker.renderers.extraction import ExtractionOutput
+
+    return {
+        MarkdownOutput: _markdown_output,
+        HTMLOutput: _html_output,
+        JSONOutput: _json_output,
+        ChunkOutput: _json_output,
+        OCRJSONOutput: _json_output,
+        ExtractionOutput: _json_output,
+    }
+
 # Helper function to unpack the rendered output from marker
 def text_from_rendered(rendered):
-    if isinstance(rendered, MarkdownOutput):
-        return rendered.markdown, "md", rendered.images
-    elif isinstance(rendered, HTMLOutput):
-        return rendered.html, "html", rendered.images
-    elif isinstance(rendered, (JSONOutput, ChunkOutput, OCRJSONOutput, ExtractionOutput)):
-        return rendered.model_dump_json(exclude=["metadata"], indent=2), "json", {}
-    else:
-        raise ValueError(f"Unsupported output type: {type(rendered)}")
+    handlers = _rendered_handlers()
+    handler = handlers.get(type(rendered))
+    if handler is None:
+        # Exact type missed — fall back to isinstance so subclasses still work
+        for cls, candidate in handlers.items():
+            if isinstance(rendered, cls):
+                handler = candidate
+                break
+        else:
+            raise ValueError(f"Unsupported output type: {type(rendered)}")
+    return handler(rendered)
 
 # Helper function to ensure images are in a save-compatible format
 def convert_if_not_rgb(image: Image.Image) -> Image.Image:
-    if image.mode != "RGB":
-        image = image.convert("RGB")
-    return image
+    if image.mode == "RGB":
+        return image
+    if image.mode == "RGBA":
+        # We only want to discard the alpha plane (the target is opaque
+        # JPEG), so slicing a zero-copy numpy view of Pillow's buffer avoids
+        # Image.convert's per-pixel compositing pass
+        return Image.fromarray(np.asarray(image)[:, :, :3], "RGB")
+    return image.convert("RGB")
+
+# Fast-path writer parameters per output format: cheapest libpng compression
+# for PNG, and baseline 4:2:0 JPEG without the progressive re-scan passes
+_IMAGE_SAVE_PARAMS = {
+    "JPEG": {"quality": 85, "subsampling": 2, "progressive": False},
+    "PNG": {"optimize": False, "compress_level": 1},
+}
+
+@functools.lru_cache(maxsize=1)
+def _output_settings() -> tuple:
+    """Snapshot (OUTPUT_ENCODING, OUTPUT_IMAGE_FORMAT) from marker's settings.
+
+    Resolved on first use and cached: marker.settings imports torch at module
+    level, so reading these eagerly would put torch back on this module's
+    import path; the cache keeps it to one attribute walk per process.
+    """
+    from marker.settings import settings
+    return settings.OUTPUT_ENCODING, settings.OUTPUT_IMAGE_FORMAT
+
+
+@functools.lru_cache(maxsize=1)
+def _log_pillow_implementation() -> None:
+    """Report once which Pillow build is doing the image encoding.
+
+    pillow-simd is a drop-in replacement whose versions carry a .postN
+    suffix; installing it speeds up the JPEG/PNG encode paths with no code
+    changes here.
+    """
+    import PIL
+    flavour = "pillow-simd" if "post" in PIL.__version__ else "Pillow"
+    print(f"Image encoding via {flavour} {PIL.__version__}")
+
+
+def _save_one_image(img_name: str, img_obj: Image.Image, image_dir_str: str,
+                    out_format: str, save_params: dict) -> None:
+    """Encode and write a single output image (thread-pool worker).
+
+    Takes the directory as a separator-terminated string so the per-image
+    path is one concatenation rather than a PosixPath construct/normalize.
+    """
+    # Only JPEG targets need the RGB conversion (no alpha channel);
+    # PNG/WebP keep their mode — converting would drop transparency
+    # and redo a full pixel traversal for nothing
+    if out_format == "JPEG":
+        img_obj = convert_if_not_rgb(img_obj)
+    # A 1 MiB userspace buffer aggregates the encoder's many small writes
+    # into a handful of syscalls; these outputs are written once and read
+    # back rarely, so also tell the kernel not to keep the pages cached.
+    with open(image_dir_str + img_name, 'wb', buffering=1 << 20) as f:
+        img_obj.save(f, out_format, **save_params)
+        f.flush()
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
 
 def save_converted_output(rendered, output_dir: Path, fname_base: str):
     """
@@ -110,40 +277,116 @@ def save_converted_output(rendered, output_dir: Path, fname_base: str):
     This function is a robust, local replacement for the library's save_output.
     """
     # 1. CRITICAL STEP: Ensure the output directory exists.
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir)
 
     # 2. Unpack the rendered data
     text_content, extension, images = text_from_rendered(rendered)
+    encoding, out_format = _output_settings()
     
-    # Ensure text is properly encoded
-    text_content = text_content.encode(settings.OUTPUT_ENCODING, errors="replace").decode(
-        settings.OUTPUT_ENCODING
-    )
-
-    # 3. Save the main text file (e.g., markdown)
-    main_file_path = output_dir / f"{fname_base}.{extension}"
-    main_file_path.write_text(text_content, encoding=settings.OUTPUT_ENCODING)
+    # 3. Save the main text file (e.g., markdown). A single encode with
+    # errors="replace" both sanitizes un-encodable characters and produces
+    # the bytes to write; the old encode -> decode -> write_text chain
+    # traversed and copied a potentially multi-MB string three times.
+    def _write_text():
+        main_file_path = output_dir / f"{fname_base}.{extension}"
+        main_file_path.write_bytes(text_content.encode(encoding, errors="replace"))
 
-    # 4. Save the metadata file
-    meta_file_path = output_dir / f"{fname_base}_meta.json"
-    meta_file_path.write_text(json.dumps(rendered.metadata, indent=2), encoding=settings.OUTPUT_ENCODING)
+    # 4. Save the metadata file — but not when there is nothing to record;
+    # batch runs otherwise litter the output tree with tiny '{}' files, each
+    # costing an inode allocation and flush
+    def _write_metadata():
+        if rendered.metadata:
+            meta_file_path = output_dir / f"{fname_base}_meta.json"
+            meta_file_path.write_bytes(_json_dumps(rendered.metadata))
 
     # 5. Save all images
-    if images:
+    def _write_images():
+        if not images:
+            return
+        _log_pillow_implementation()
         # Create an 'images' subdirectory for organization
         image_dir = output_dir / 'images'
-        image_dir.mkdir(exist_ok=True)
-        for img_name, img_obj in images.items():
-            img_obj = convert_if_not_rgb(img_obj)
-            # It's better to save images in their own folder
-            img_path = image_dir / img_name
-            img_obj.save(img_path, settings.OUTPUT_IMAGE_FORMAT)
+        _ensure_dir(image_dir)
+        save_params = _IMAGE_SAVE_PARAMS.get(out_format, {})
+        image_dir_str = str(image_dir) + os.sep
+        # Pillow's C encoders release the GIL, so independent per-file encodes
+        # genuinely overlap on threads without any pickling overhead
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(images))) as pool:
+            list(pool.map(
+                lambda kv: _save_one_image(kv[0], kv[1], image_dir_str, out_format, save_params),
+                images.items()
+            ))
+
+    # The three outputs share no state, and both the JSON C-encoder and the
+    # write syscalls release the GIL, so metadata serialization and the text
+    # write hide behind the image-encoding wall time
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(fn) for fn in (_write_text, _write_metadata, _write_images)]
+        for future in futures:
+            future.result()
+
+
+# Below this size the kernel's default readahead is already sufficient
+_PREFETCH_THRESHOLD = 32 * 1024 * 1024
+
+def _prefetch_pdf(input_path: str) -> None:
+    """Ask the kernel to prefetch a large PDF before marker starts reading it.
+
+    marker's converter only accepts a filesystem path, so we can't hand it an
+    mmap'd buffer; fadvise hints give the same cold-start benefit by letting
+    the prefetcher run ahead of the page-by-page reads.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(input_path, os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size > _PREFETCH_THRESHOLD:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+# Models for this process, created lazily by convert_pdf's first call
+_WORKER_MODELS = None
+
+@functools.lru_cache(maxsize=4)
+def _get_converter(langs: str, max_pages: int, batch_multiplier: int):
+    """Build (and cache) the ConfigParser and converter for a config tuple.
+
+    Converter construction rebuilds config/schema state on every call, which
+    is pure overhead when converting many PDFs with the same settings; the
+    heavy object is retained and reused instead. Uses the module-level models
+    set by convert_pdf / the worker initializer.
+    """
+    from marker.config.parser import ConfigParser
+
+    # Create a dictionary of settings for ConfigParser, mimicking how the CLI
+    # passes arguments; None values are dropped so library defaults apply
+    config_settings = {
+        "langs": langs.split(",") if langs else None,
+        "max_pages": max_pages,
+        "batch_multiplier": batch_multiplier,
+    }
+    config_settings = {k: v for k, v in config_settings.items() if v is not None}
+
+    config_parser = ConfigParser(config_settings)
+    converter_cls = config_parser.get_converter_cls()
+    converter = converter_cls(
+        config=config_parser.generate_config_dict(),
+        artifact_dict=_WORKER_MODELS,  # Pass in the pre-loaded models
+    )
+    print(f"Using converter: {converter_cls.__name__}")
+    return config_parser, converter
 
 
 def convert_pdf(
     input_path: str,
     output_dir: Path,
-    models: dict,
+    models_factory,
     batch_multiplier: int,
     max_pages: int,
     langs: str
@@ -154,32 +397,24 @@ def convert_pdf(
     Args:
         input_path: Path to the PDF file.
         output_dir: Directory to save the output.
-        models: Pre-loaded dictionary of models.
+        models_factory: Zero-arg callable returning the models dict (e.g.
+            create_model_dict). Invoked lazily on the first conversion in
+            this process, so runs that never convert anything never pay the
+            model load time or RSS.
         ... other settings
     """
+    global _WORKER_MODELS
     try:
-        # 1. Create a dictionary of settings for ConfigParser
-        #    This mimics how the CLI passes arguments
-        settings = {
-            "langs": langs.split(",") if langs else None,
-            "max_pages": max_pages,
-            "batch_multiplier": batch_multiplier,
-        }
-        # Filter out None values so we don't override library defaults
-        settings = {k: v for k, v in settings.items() if v is not None}
-
-        # 2. Use ConfigParser to handle all configuration
-        config_parser = ConfigParser(settings)
+        if _WORKER_MODELS is None:
+            print("Loading models (this may take a moment)...")
+            _WORKER_MODELS = models_factory()
+            # Converters cached before the models existed are unusable
+            _get_converter.cache_clear()
 
-        # 3. Get the converter class and instantiate it correctly
-        converter_cls = config_parser.get_converter_cls()
-        converter = converter_cls(
-            config=config_parser.generate_config_dict(),
-            artifact_dict=models,  # Pass in the pre-loaded models
-        )
-        print(f"Using converter: {converter_cls.__name__}")
+        config_parser, converter = _get_converter(langs, max_pages, batch_multiplier)
 
-        # 4. Run the conversion. The converter is a callable class.
+        # Run the conversion. The converter is a callable class.
+        _prefetch_pdf(input_path)
         rendered = converter(input_path)
 
         print(f"Conversion completed for: {input_path}")
@@ -193,7 +428,184 @@ def convert_pdf(
     except Exception as e:
         print(f"❌ Error converting {input_path}: {type(e).__name__} - {e}", file=sys.stderr)
 
-    
+
+def _init_worker(num_gpus: int = 0, worker_counter=None):
+    """Prepare a worker process for PDF conversion.
+
+    Only device placement happens here; the models themselves load lazily in
+    convert_pdf on the worker's first task, so a worker that is never
+    assigned work never pays the load cost.
+    """
+    if num_gpus > 1 and worker_counter is not None:
+        # Atomically take the next worker index from the shared counter so
+        # workers round-robin across GPUs. (Spawned pids are not consecutive,
+        # so pid-based assignment can land every worker on the same device.)
+        # Must happen before the models initialize CUDA in this process.
+        with worker_counter.get_lock():
+            worker_index = worker_counter.value
+            worker_counter.value += 1
+        os.environ['CUDA_VISIBLE_DEVICES'] = str(worker_index % num_gpus)
+
+
+def _convert_one(task) -> str:
+    """Worker entry point: convert a single PDF using the worker's models."""
+    from marker.models import create_model_dict
+
+    input_path, output_dir, batch_multiplier, max_pages, langs = task
+    convert_pdf(
+        input_path=input_path,
+        output_dir=output_dir,
+        models_factory=create_model_dict,
+        batch_multiplier=batch_multiplier,
+        max_pages=max_pages,
+        langs=langs
+    )
+    return input_path
+
+
+def convert_pdfs(
+    queue: list[Path],
+    output_root: Path,
+    batch_multiplier: int,
+    max_pages: int,
+    langs: str,
+    jobs: int
+):
+    """
+    Convert a batch of PDFs concurrently across worker processes.
+
+    Documents are independent of each other, so this is trivially
+    data-parallel; processes (not threads) are used because marker holds the
+    GIL during its Python work. Each worker loads the models once via the
+    pool initializer and reuses them for every PDF it is assigned.
+    """
+    try:
+        import torch
+        num_gpus = torch.cuda.device_count() if torch.cuda.is_available() else 0
+    except ImportError:
+        num_gpus = 0
+
+    max_workers = min(jobs, len(queue), os.cpu_count() or 1)
+    # spawn (rather than fork) so workers initialize CUDA cleanly
+    ctx = multiprocessing.get_context('spawn')
+    # Shared counter the initializer increments to assign each worker a GPU
+    worker_counter = ctx.Value('i', 0)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(num_gpus, worker_counter)
+    ) as pool:
+        futures = {
+            pool.submit(
+                _convert_one,
+                (str(pdf_path), output_root / pdf_path.stem, batch_multiplier, max_pages, langs)
+            ): pdf_path
+            for pdf_path in queue
+        }
+        for future in concurrent.futures.as_completed(futures):
+            pdf_path = futures[future]
+            try:
+                future.result()
+                print(f"Finished: {pdf_path.name}")
+            except Exception as e:
+                print(f"Error processing {pdf_path.name}: {type(e).__name__} - {e}", file=sys.stderr)
+
+
+async def _run_pipeline(
+    queue: list[Path],
+    output_root: Path,
+    models_factory,
+    batch_multiplier: int,
+    max_pages: int,
+    langs: str
+):
+    """Three-stage asyncio pipeline: prefetch -> convert -> write.
+
+    Each stage runs its blocking work on its own single-thread executor, so
+    while the converter is busy with document N the reader is already warming
+    the page cache for N+1 and the writer is flushing N-1's output. The
+    bounded queues keep at most one document buffered between stages, which
+    caps memory while still hiding read and write latency behind inference.
+    """
+    global _WORKER_MODELS
+    loop = asyncio.get_running_loop()
+    ready_q: asyncio.Queue = asyncio.Queue(maxsize=2)
+    write_q: asyncio.Queue = asyncio.Queue(maxsize=2)
+    # One worker per stage: the single converter thread doubles as the GPU
+    # semaphore, and single reader/writer threads keep disk access sequential
+    read_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    convert_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    write_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    async def reader():
+        for pdf_path in queue:
+            await loop.run_in_executor(read_pool, _prefetch_pdf, str(pdf_path))
+            await ready_q.put(pdf_path)
+        await ready_q.put(None)
+
+    async def converter_stage():
+        global _WORKER_MODELS
+        while True:
+            pdf_path = await ready_q.get()
+            if pdf_path is None:
+                await write_q.put(None)
+                return
+            try:
+                if _WORKER_MODELS is None:
+                    print("Loading models (this may take a moment)...")
+                    _WORKER_MODELS = await loop.run_in_executor(convert_pool, models_factory)
+                    _get_converter.cache_clear()
+                config_parser, converter = _get_converter(langs, max_pages, batch_multiplier)
+                rendered = await loop.run_in_executor(convert_pool, converter, str(pdf_path))
+                base_filename = config_parser.get_base_filename(str(pdf_path))
+                await write_q.put((pdf_path, rendered, base_filename))
+            except Exception as e:
+                print(f"❌ Error converting {pdf_path}: {type(e).__name__} - {e}", file=sys.stderr)
+
+    async def writer():
+        while True:
+            item = await write_q.get()
+            if item is None:
+                return
+            pdf_path, rendered, base_filename = item
+            try:
+                await loop.run_in_executor(
+                    write_pool,
+                    save_converted_output, rendered, output_root / pdf_path.stem, base_filename
+                )
+                print(f"Finished: {pdf_path.name}")
+            except Exception as e:
+                print(f"Error saving {pdf_path.name}: {type(e).__name__} - {e}", file=sys.stderr)
+
+    try:
+        await asyncio.gather(reader(), converter_stage(), writer())
+    finally:
+        for pool in (read_pool, convert_pool, write_pool):
+            pool.shutdown(wait=False)
+
+
+def convert_pdfs_pipelined(
+    queue: list[Path],
+    output_root: Path,
+    models_factory,
+    batch_multiplier: int,
+    max_pages: int,
+    langs: str
+):
+    """
+    Convert a batch of PDFs in this process with read/convert/write overlapped.
+
+    Complements convert_pdfs: that one scales across processes when several
+    GPUs or cores are available, while this keeps a single converter (one
+    model copy, one GPU) fully busy by pipelining the disk-bound stages of
+    neighbouring documents around it.
+    """
+    asyncio.run(_run_pipeline(
+        queue, output_root, models_factory, batch_multiplier, max_pages, langs
+    ))
+
+
 def add_pdfs_to_queue(input_path: Path) -> list[Path]:
     """
     Add PDF files to the processing queue.
@@ -203,7 +615,15 @@ def add_pdfs_to_queue(input_path: Path) -> list[Path]:
     queue = []
     
     if input_path.is_dir():
-        pdfs = list(input_path.glob('*.pdf'))
+        # os.scandir beats Path.glob here: one pass, no fnmatch per entry, and
+        # DirEntry.is_file() reuses type info cached from the directory read.
+        # Lowercasing only the 4-char suffix slice avoids allocating a full
+        # lowercased copy of every filename in the directory.
+        with os.scandir(input_path) as it:
+            pdfs = sorted(
+                Path(entry.path) for entry in it
+                if entry.is_file() and entry.name[-4:].lower() == '.pdf'
+            )
         if not pdfs:
             print(f"No PDF files found in directory: {input_path}", file=sys.stderr)
             sys.exit(1)
@@ -212,7 +632,7 @@ def add_pdfs_to_queue(input_path: Path) -> list[Path]:
         if not input_path.is_file():
             print(f"Error: Input file does not exist: {input_path}", file=sys.stderr)
             sys.exit(1)
-        if input_path.suffix.lower() != '.pdf':
+        if input_path.name[-4:].lower() != '.pdf':
             print(f"Error: Input file must be a PDF: {input_path}", file=sys.stderr)
             sys.exit(1)
         queue.append(input_path)